@@ -1,10 +1,13 @@
 #!/usr/bin/env python3
 """Build agent role files by combining source fragments."""
 
+import os
 import re
 import sys
 from pathlib import Path
 
+HEADER_RE = re.compile(r'^(#+) ', re.MULTILINE)
+
 
 def increase_header_levels(content: str) -> str:
     """Increase markdown header levels by one.
@@ -15,7 +18,7 @@ def increase_header_levels(content: str) -> str:
     Returns:
         Content with headers increased by one level
     """
-    return re.sub(r'^(#+) ', r'#\1 ', content, flags=re.MULTILINE)
+    return HEADER_RE.sub(r'#\1 ', content)
 
 
 def build_role(output_path: Path, role_title: str, *source_files: Path) -> None:
@@ -28,30 +31,33 @@ def build_role(output_path: Path, role_title: str, *source_files: Path) -> None:
     """
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with output_path.open("w") as out:
-        # Write role title
-        out.write(f"# {role_title}\n\n")
-        out.write("---\n\n")
+    # Build content in memory, then write once
+    parts = [f"# {role_title}\n\n---\n\n"]
+
+    # Combine source files
+    for i, src_file in enumerate(source_files):
+        if not src_file.exists():
+            print(f"Warning: {src_file} does not exist", file=sys.stderr)
+            continue
 
-        # Combine source files
-        for i, src_file in enumerate(source_files):
-            if not src_file.exists():
-                print(f"Warning: {src_file} does not exist", file=sys.stderr)
-                continue
+        content = src_file.read_text()
 
-            content = src_file.read_text()
+        # Add separator between sections (but not before first)
+        if i > 0:
+            parts.append("\n---\n\n")
 
-            # Add separator between sections (but not before first)
-            if i > 0:
-                out.write("\n---\n\n")
+        # Increase header levels
+        content = increase_header_levels(content)
+        parts.append(content)
 
-            # Increase header levels and write source content
-            content = increase_header_levels(content)
-            out.write(content)
+        # Ensure newline at end
+        if not content.endswith("\n"):
+            parts.append("\n")
 
-            # Ensure newline at end
-            if not content.endswith("\n"):
-                out.write("\n")
+    # Write to a sibling temp file and replace atomically
+    tmp_path = output_path.with_suffix(output_path.suffix + ".tmp")
+    tmp_path.write_text("".join(parts))
+    os.replace(tmp_path, output_path)
 
 
 def main() -> None:
@@ -26,7 +26,9 @@ import sys
 
 show_lines = "--lines" in sys.argv
 
-for line in sys.stdin:
+# Read bytes and let json.loads parse them directly, skipping the
+# TextIOWrapper decode step
+for line in sys.stdin.buffer:
     if not line.strip():
         continue
     d = json.loads(line)
@@ -9,19 +9,22 @@ might benefit from compaction. It identifies closing delimiters at line start,
 filters to outermost only, and outputs context for analysis.
 """
 
+import functools
 import re
 import subprocess
 import sys
+import tokenize
+from collections import deque
+from itertools import groupby
 from pathlib import Path
 from typing import TYPE_CHECKING, NamedTuple
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import Iterable, Iterator, Sequence
 
 # Constants
 FILE_HEADER = re.compile(r"^diff --git a/.+ b/(.+\.py)$")
 CHUNK_HEADER = re.compile(r"^@@ -\d+(?:,\d+)? \+(\d+)(?:,\d+)? @@")
-CLOSING_LINE = re.compile(r"^\+(\s*)([)\]}])\s*$")
 OPENERS: dict[str, str] = {")": "(", "]": "[", "}": "{"}
 CONTEXT_LINES: int = 5
 CONTIGUITY_THRESHOLD = 5  # Max line gap within a block
@@ -43,91 +46,94 @@ class DiffBlock(NamedTuple):
     delimiters: list[ClosingDelimiter]  # Sorted by line_no descending
 
 
-def parse_diff(diff_text: str) -> Iterator[ClosingDelimiter]:
-    """Parse git diff, yield closing delimiters in added Python lines."""
+def _closing(line: str) -> tuple[int, str] | None:
+    """Indent and closer for added lines like "+    )", else None.
+
+    Pure string inspection; equivalent to matching the line against
+    the regex ``^\\+(\\s*)([)\\]}])\\s*$``.
+    """
+    body = line[1:]
+    stripped = body.strip()
+    if stripped not in (")", "]", "}"):
+        return None
+    return len(body) - len(body.lstrip()), stripped
+
+
+def parse_diff(diff_lines: Iterable[str]) -> Iterator[ClosingDelimiter]:
+    """Parse git diff lines, yield closing delimiters in added lines."""
     current_file: str | None = None
     current_line = 0
 
-    for line in diff_text.splitlines():
-        # Skip --- and +++ file marker lines
-        if line.startswith(("---", "+++")):
-            continue
+    for line in diff_lines:
+        # Gate each regex on a literal prefix so common diff lines
+        # (additions, deletions, context) never enter the regex engine
+        first = line[:1]
 
-        # Match file header
-        if match := FILE_HEADER.match(line):
-            current_file = match[1]
+        # Match file header (only "diff --git" lines start with "d")
+        if first == "d":
+            if match := FILE_HEADER.match(line):
+                current_file = match[1]
             continue
 
         # Match chunk header to get line number
-        if match := CHUNK_HEADER.match(line):
-            current_line = int(match[1])
+        if first == "@":
+            if match := CHUNK_HEADER.match(line):
+                current_line = int(match[1])
             continue
 
         # Skip if not in Python file
         if not current_file:
             continue
 
-        # Check for added line with closing delimiter at line end
-        if match := CLOSING_LINE.match(line):
-            indent_str, closer = match.groups()
-            yield ClosingDelimiter(
-                current_file,
-                current_line,
-                len(indent_str),
-                closer,
-            )
-
-        # Track line numbers for added/unchanged lines
-        if line.startswith(("+", " ")):
+        if first == "+":
+            # Skip the +++ file marker line
+            if line.startswith("+++"):
+                continue
+
+            # Check for added line with closing delimiter at line end
+            if closing := _closing(line):
+                indent, closer = closing
+                yield ClosingDelimiter(
+                    current_file,
+                    current_line,
+                    indent,
+                    closer,
+                )
+            current_line += 1
+        elif first == " ":
+            # Track line numbers for unchanged lines
             current_line += 1
 
 
 def filter_outermost(
-    delimiters: list[ClosingDelimiter],
+    delimiters: Iterable[ClosingDelimiter],
 ) -> Iterator[ClosingDelimiter]:
     """Keep only outermost delimiters from contiguous blocks."""
-    # Group by file
-    by_file: dict[str, list[ClosingDelimiter]] = {}
-    for d in delimiters:
-        by_file.setdefault(d.filepath, []).append(d)
-
-    # Collect results to maintain input order
-    results: list[ClosingDelimiter] = []
-
-    # Process each file's delimiters
-    for file_delims in by_file.values():
-        # Sort by line number descending for backward scan
-        file_delims.sort(key=lambda d: d.line_no, reverse=True)
-
-        # Split into contiguous blocks
-        blocks: list[list[ClosingDelimiter]] = []
+    # Single global sort: filepath ascending, line numbers descending
+    # within a file for the backward scan.
+    ordered = sorted(delimiters, key=lambda d: (d.filepath, -d.line_no))
+
+    for _, group in groupby(ordered, key=lambda d: d.filepath):
+        # Blocks come out highest-lines-first; extendleft restores
+        # ascending output order without a second sort.
+        results: deque[ClosingDelimiter] = deque()
         current_block: list[ClosingDelimiter] = []
         prev_line: int | None = None
 
-        for delim in file_delims:
+        for delim in group:
             # Check if delimiter is within threshold of previous line
             is_contiguous = (
                 prev_line is None
                 or prev_line - delim.line_no <= CONTIGUITY_THRESHOLD
             )
-            if is_contiguous:
-                current_block.append(delim)
-            else:
-                if current_block:
-                    blocks.append(current_block)
-                current_block = [delim]
+            if not is_contiguous:
+                results.extendleft(_keep_outermost_in_block(current_block))
+                current_block = []
+            current_block.append(delim)
             prev_line = delim.line_no
 
-        if current_block:
-            blocks.append(current_block)
-
-        # Filter each block to outermost
-        for block in blocks:
-            results.extend(_keep_outermost_in_block(block))
-
-    # Sort results by filepath and line_no to match input order
-    results.sort(key=lambda d: (d.filepath, d.line_no))
-    yield from results
+        results.extendleft(_keep_outermost_in_block(current_block))
+        yield from results
 
 
 def _keep_outermost_in_block(
@@ -142,8 +148,44 @@ def _keep_outermost_in_block(
             min_indent_after = delim.indent
 
 
+@functools.lru_cache(maxsize=128)
+def _read_lines(filepath: str) -> tuple[str, ...] | None:
+    """Read newline-stripped lines once per file, None if missing."""
+    try:
+        with Path(filepath).open() as f:
+            return tuple(line.rstrip("\n") for line in f)
+    except FileNotFoundError:
+        return None
+
+
+@functools.lru_cache(maxsize=8)
+def _bracket_deltas(
+    lines: tuple[str, ...], closer: str
+) -> tuple[int, ...]:
+    """Net per-line depth delta for one bracket kind.
+
+    Tokenizes the source so brackets inside strings and comments are
+    not counted.  Falls back to literal counting when the source does
+    not tokenize (e.g. a fragment with unbalanced brackets).
+    """
+    opener = OPENERS[closer]
+    readline = iter([line + "\n" for line in lines]).__next__
+    try:
+        tokens = list(tokenize.generate_tokens(readline))
+    except (tokenize.TokenError, IndentationError, SyntaxError):
+        return tuple(
+            line.count(closer) - line.count(opener) for line in lines
+        )
+    deltas = [0] * len(lines)
+    for tok in tokens:
+        if tok.type == tokenize.OP and tok.string in (closer, opener):
+            delta = 1 if tok.string == closer else -1
+            deltas[tok.start[0] - 1] += delta
+    return tuple(deltas)
+
+
 def find_opener(
-    lines: list[str],
+    lines: Sequence[str],
     close_line: int,
     closer: str,
 ) -> int | None:
@@ -151,34 +193,30 @@ def find_opener(
 
     Returns None if not found.
     """
-    opener = OPENERS[closer]
+    deltas = _bracket_deltas(tuple(lines), closer)
     depth = 1  # Start at 1 for the closing delimiter
 
-    # Walk backwards from line before closer
+    # Walk backwards from line before closer, applying each line's net
+    # bracket delta
     for line_idx in range(close_line - 1, -1, -1):
-        line = lines[line_idx]
-
-        # Count openers and closers in this line
-        for char in line:
-            if char == closer:
-                depth += 1
-            elif char == opener:
-                depth -= 1
-                if depth == 0:
-                    return line_idx
+        depth += deltas[line_idx]
+        if depth <= 0:
+            return line_idx
 
     return None  # No matching opener found
 
 
 def output_context(
     filepath: str,
+    lines: Sequence[str],
     close_idx: int,
     opener_idx: int,
 ) -> None:
     """Output context: CONTEXT_LINES before opener through closer.
 
     Args:
-        filepath: Path to the file
+        filepath: Path to the file (for the header only)
+        lines: Newline-stripped file lines
         close_idx: 0-indexed line number of closing delimiter
         opener_idx: 0-indexed line number of opening delimiter
     """
@@ -188,14 +226,6 @@ def output_context(
     start_line = max(1, opener_line - CONTEXT_LINES)
     end_line = close_line
 
-    # Read file lines
-    try:
-        with Path(filepath).open() as f:
-            lines = f.readlines()
-    except FileNotFoundError:
-        print(f"Warning: File not found: {filepath}", file=sys.stderr)  # noqa: T201
-        return
-
     # Print header (use basename for cleaner output)
     filename = Path(filepath).name
     print(f"=== {filename}:{start_line}-{end_line} ===")  # noqa: T201
@@ -203,46 +233,46 @@ def output_context(
     # Print numbered lines
     for line_num in range(start_line, end_line + 1):
         if line_num <= len(lines):
-            content = lines[line_num - 1].rstrip("\n")
-            print(f"{line_num:4d}: {content}")  # noqa: T201
+            print(f"{line_num:4d}: {lines[line_num - 1]}")  # noqa: T201
 
 
 def main() -> None:
     """Find and output multi-line expressions in git diff."""
-    # Get git diff
-    result = subprocess.run(
+    # Stream git diff without buffering the whole output
+    with subprocess.Popen(
         ["git", "diff", "--unified=0", "HEAD"],
-        capture_output=True,
+        stdout=subprocess.PIPE,
         text=True,
-        check=True,
-    )
-    diff_text = result.stdout
-
-    # Parse diff to find closing delimiters
-    all_delimiters = list(parse_diff(diff_text))
+    ) as process:
+        assert process.stdout is not None
+        # Parse diff and filter to outermost, without materializing the
+        # full delimiter list (filter_outermost buckets internally)
+        outermost = filter_outermost(parse_diff(process.stdout))
+        _output_contexts(outermost)
+    if process.returncode:
+        raise subprocess.CalledProcessError(
+            process.returncode, process.args
+        )
 
-    # Filter to outermost
-    outermost = list(filter_outermost(all_delimiters))
 
-    # For each delimiter, find opener and output context
+def _output_contexts(outermost: Iterable[ClosingDelimiter]) -> None:
+    """Find opener and output context for each delimiter."""
     first = True
     for delim in outermost:
-        # Read file to find opener
-        try:
-            with Path(delim.filepath).open() as f:
-                lines = f.readlines()
-        except FileNotFoundError:
+        # Read each file once, shared by find_opener and output_context
+        lines = _read_lines(delim.filepath)
+        if lines is None:
+            print(  # noqa: T201
+                f"Warning: File not found: {delim.filepath}",
+                file=sys.stderr,
+            )
             continue
 
         # Convert to 0-indexed
         close_idx = delim.line_no - 1
 
         # Find opener
-        opener_idx = find_opener(
-            [line.rstrip("\n") for line in lines],
-            close_idx,
-            delim.closer,
-        )
+        opener_idx = find_opener(lines, close_idx, delim.closer)
 
         if opener_idx is None:
             # Fallback to showing from line 1
@@ -252,7 +282,7 @@ def main() -> None:
         if not first:
             print()  # noqa: T201  # Blank line between blocks
         first = False
-        output_context(delim.filepath, close_idx, opener_idx)
+        output_context(delim.filepath, lines, close_idx, opener_idx)
 
 
 if __name__ == "__main__":
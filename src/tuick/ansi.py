@@ -33,4 +33,8 @@ def strip_ansi(text: str) -> str:
     - CSI sequences: ESC [ params intermediates final
       Common: ESC[31m (red), ESC[1;32m (bold green), ESC[0m (reset)
     """
+    # Every sequence starts with ESC; a C-level scan for it is much
+    # cheaper than running the regex on escape-free lines.
+    if "\x1b" not in text:
+        return text
     return ANSI_REGEX.sub("", text)
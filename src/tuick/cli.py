@@ -5,6 +5,8 @@ text editor to provide fluid, keyboard-friendly, access to code error
 locations.
 """
 
+import codecs
+import functools
 import os
 import shutil
 import socket
@@ -269,6 +271,19 @@ def main(  # noqa: PLR0913, C901, PLR0912
                 )
 
 
+@functools.cache
+def _shorten_self_name(myself: str) -> str:
+    """Shorten the command name if it is the same as the default.
+
+    Cached: shutil.which walks PATH and stats every candidate, and the
+    answer cannot change within one tuick process.
+    """
+    default: str | None = shutil.which(Path(myself).name)
+    if default and Path(default).resolve() == Path(myself).resolve():
+        return Path(myself).name
+    return myself
+
+
 class CallbackCommands:
     """Utility class for generating CLI callback commands."""
 
@@ -281,11 +296,7 @@ class CallbackCommands:
         explicit_top: bool = False,
     ) -> None:
         """Initialize callback commands."""
-        # Shorten the command name if it is the same as the default
-        myself = sys.argv[0]
-        default: str | None = shutil.which(Path(myself).name)
-        if default and Path(default).resolve() == Path(myself).resolve():
-            myself = Path(myself).name
+        myself = _shorten_self_name(sys.argv[0])
 
         # Build format options
         format_opts: list[str] = []
@@ -371,7 +382,10 @@ def list_command(  # noqa: C901, PLR0913, PLR0915
             reload_server.save_output_chunk(chunk)
 
         if top_mode:
-            chunks = _parse_top_mode(config, cmd_proc.stdout, save_raw)
+            # Top mode does not need line framing: feed bulk-decoded
+            # chunks to the marker splitter
+            decoded = _iter_decoded_chunks(cmd_proc.stdout)
+            chunks = _parse_top_mode(config, decoded, save_raw)
         else:
             raw_lines = _iter_raw_lines_and_save(cmd_proc.stdout, save_raw)
             chunks = parse_with_errorformat(config, raw_lines)
@@ -394,10 +408,12 @@ def list_command(  # noqa: C901, PLR0913, PLR0915
         ) as fzf_proc:
             assert fzf_proc.stdin is not None
 
-            # Write all chunks to fzf
+            # Write all chunks to fzf: the first block is flushed so
+            # fzf paints immediately, the rest ride the stdin buffer
+            # so write syscalls are batched; close flushes the tail
             _write_block_and_maybe_flush(fzf_proc.stdin, first_chunk)
             for chunk in chunks:
-                _write_block_and_maybe_flush(fzf_proc.stdin, chunk)
+                fzf_proc.stdin.write(chunk)
 
             reload_server.end_output()
             fzf_proc.stdin.close()
@@ -409,12 +425,7 @@ def list_command(  # noqa: C901, PLR0913, PLR0915
             # User abort - print saved output if available
             output_file = reload_server.get_saved_output_file()
             if output_file:
-                chunk_size = 8192
-                while True:
-                    chunk = output_file.read(chunk_size)
-                    if not chunk:
-                        break
-                    sys.stdout.write(chunk)
+                shutil.copyfileobj(output_file, sys.stdout, 64 * 1024)
         elif fzf_proc.returncode not in (0, 1):
             # 0 normal exit, 1 no match
             sys.exit(1)
@@ -431,16 +442,31 @@ def _connect_to_tuick_server() -> typing.Iterator[socket.socket]:
         raise typer.Exit(1)
 
     with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
         sock.connect(("127.0.0.1", int(tuick_port)))
         sock.sendall(f"secret: {tuick_api_key}\n".encode())
         yield sock
 
 
+def _read_server_response(sock: socket.socket) -> str:
+    """Read one newline-terminated response line from the server.
+
+    A single recv can return a partial line; keep reading until the
+    newline arrives or the server closes the connection.
+    """
+    chunks = []
+    while data := sock.recv(1024):
+        chunks.append(data)
+        if b"\n" in data:
+            break
+    return b"".join(chunks).decode().strip()
+
+
 def _send_to_tuick_server(message: str, expected: str) -> None:
     """Send authenticated message to tuick server and verify response."""
     with _connect_to_tuick_server() as sock:
         sock.sendall(f"{message}\n".encode())
-        response = sock.recv(1024).decode().strip()
+        response = _read_server_response(sock)
         if response != expected:
             print_error(None, "Server response:", response)
             raise typer.Exit(1)
@@ -456,18 +482,46 @@ def _create_command_process(
         server_info: Optional (port, api_key) to set TUICK_PORT/API_KEY.
             If None, inherits from os.environ (for reload/format commands).
     """
-    env = os.environ.copy()
-    env["FORCE_COLOR"] = "1"
+    overrides = {"FORCE_COLOR": "1"}
     if server_info:
         port, api_key = server_info
-        env["TUICK_PORT"] = str(port)
-        env["TUICK_API_KEY"] = api_key
+        overrides["TUICK_PORT"] = str(port)
+        overrides["TUICK_API_KEY"] = api_key
+    env = os.environ | overrides
     print_command(command)
+    # A wide pipe lets tools that burst output run ahead while tuick is
+    # still parsing; ignored on platforms without F_SETPIPE_SZ
     return subprocess.Popen(
-        command, stdout=PIPE, stderr=STDOUT, text=True, env=env
+        command,
+        stdout=PIPE,
+        stderr=STDOUT,
+        text=True,
+        env=env,
+        pipesize=1 << 20,
     )
 
 
+def _iter_decoded_chunks(stream: typing.IO[str]) -> Iterator[str]:
+    """Yield decoded chunks from bulk reads of a text pipe.
+
+    Reading 64KiB chunks from the underlying binary buffer skips the
+    per-line TextIOWrapper machinery; the incremental decoder handles
+    multi-byte sequences split across chunks.  Falls back to plain
+    iteration for streams without a binary buffer (e.g. in tests).
+    """
+    buffer = getattr(stream, "buffer", None)
+    if buffer is None:
+        yield from stream
+        return
+    encoding = getattr(stream, "encoding", None)
+    decoder = codecs.getincrementaldecoder(encoding or "utf-8")()
+    while chunk := buffer.read1(64 * 1024):
+        if text := decoder.decode(chunk):
+            yield text
+    if text := decoder.decode(b"", final=True):
+        yield text
+
+
 def _buffer_chunks(
     raw_iterator: Iterator[str], chunk_size: int = 8192
 ) -> Iterator[str]:
@@ -484,6 +538,23 @@ def _buffer_chunks(
         yield remaining
 
 
+def _write_blocks_buffered(
+    output: typing.IO[str], blocks: Iterator[str]
+) -> None:
+    """Write blocks to output, first one eagerly then in big chunks.
+
+    The first block is flushed immediately so fzf can display the first
+    entry; the rest is batched through _buffer_chunks to cut per-block
+    write and flush overhead on large outputs.
+    """
+    for block in blocks:
+        _write_block_and_maybe_flush(output, block)
+        if len(block) > 1:
+            break
+    for chunk in _buffer_chunks(blocks):
+        _write_block_and_maybe_flush(output, chunk)
+
+
 def _write_block_and_maybe_flush(output: typing.IO[str], block: str) -> None:
     """Write block to output and flush if block is substantial.
 
@@ -530,7 +601,7 @@ def _save_raw_to_server() -> Iterator[Callable[[str], None]]:
 
         yield save_raw
         sock.sendall(b"end\n")
-        response = sock.recv(1024).decode().strip()
+        response = _read_server_response(sock)
         if response != "ok":
             print_error(None, "Server response:", response)
             raise typer.Exit(1)
@@ -549,12 +620,12 @@ def reload_command(
         ):
             assert proc.stdout is not None
             if top_mode:
-                for block in _parse_top_mode(config, proc.stdout, save_raw):
-                    _write_block_and_maybe_flush(sys.stdout, block)
+                decoded = _iter_decoded_chunks(proc.stdout)
+                blocks = _parse_top_mode(config, decoded, save_raw)
             else:
                 raw_lines = _iter_raw_lines_and_save(proc.stdout, save_raw)
-                for block in parse_with_errorformat(config, raw_lines):
-                    _write_block_and_maybe_flush(sys.stdout, block)
+                blocks = parse_with_errorformat(config, raw_lines)
+            _write_blocks_buffered(sys.stdout, blocks)
 
         print_verbose("  Command exit:", proc.returncode)
         _send_to_tuick_server("end-output", "ok")
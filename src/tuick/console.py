@@ -2,11 +2,12 @@
 
 import os
 import sys
+import threading
 import traceback
 from contextlib import contextmanager
 from pathlib import Path
 from tempfile import NamedTemporaryFile
-from typing import IO, TYPE_CHECKING, Any
+from typing import IO, TYPE_CHECKING, Any, cast
 
 from rich.console import Console
 from rich.markup import escape
@@ -21,11 +22,84 @@ if TYPE_CHECKING:
 TUICK_LOG_FILE = "TUICK_LOG_FILE"
 
 
-_console = Console(soft_wrap=True, stderr=True)
+_console: Console | None = None
 _verbose = False
 _trace = False
 
 
+def _get_console() -> Console:
+    """Return the shared console, creating it on first use.
+
+    Lazy so that short-lived subcommands that never print (e.g. fzf
+    event callbacks outside verbose mode) skip terminal detection.
+    Tests patch _console directly with a capture console.
+    """
+    global _console  # noqa: PLW0603
+    if _console is None:
+        _console = Console(soft_wrap=True, stderr=True)
+        _console.file = cast("IO[str]", _DeferredFlushFile(sys.stderr))
+    return _console
+
+
+# Debounced flushing: verbose fzf callbacks emit bursts of messages and
+# a flush syscall per line adds up.  rich flushes after every print, so
+# the console file is wrapped to turn that flush into a short timer
+# that coalesces bursts.  print_error flushes synchronously.
+_FLUSH_DELAY = 0.01
+_flush_timer: threading.Timer | None = None
+_flush_lock = threading.Lock()
+
+
+class _DeferredFlushFile:
+    """Console file wrapper that defers flushes to the debounce timer.
+
+    Writes pass straight through; flush schedules a coalesced flush of
+    the wrapped file instead of a syscall per print.
+    """
+
+    def __init__(self, file: IO[str]) -> None:
+        self.file = file
+
+    def write(self, text: str) -> int:
+        return self.file.write(text)
+
+    def flush(self) -> None:
+        _flush_soon()
+
+    def __getattr__(self, name: str) -> Any:  # noqa: ANN401
+        return getattr(self.file, name)
+
+
+def _flush_soon() -> None:
+    """Schedule a debounced flush, coalescing bursts of messages."""
+    global _flush_timer  # noqa: PLW0603
+    with _flush_lock:
+        if _flush_timer is not None:
+            return
+        _flush_timer = threading.Timer(_FLUSH_DELAY, flush_now)
+        _flush_timer.daemon = True
+        _flush_timer.start()
+
+
+def flush_now() -> None:
+    """Flush the console file immediately, cancelling any pending flush."""
+    global _flush_timer  # noqa: PLW0603
+    with _flush_lock:
+        if _flush_timer is not None:
+            _flush_timer.cancel()
+            _flush_timer = None
+    if _console is None:
+        return
+    file = _console.file
+    if isinstance(file, _DeferredFlushFile):
+        file = file.file
+    try:
+        file.flush()
+    except ValueError:
+        # File already closed (e.g. log file teardown raced the timer)
+        pass
+
+
 def set_verbose() -> None:
     """Turn on verbose mode.
 
@@ -43,38 +117,34 @@ def is_verbose() -> bool:
 def print_verbose(*args: Any) -> None:  # noqa: ANN401
     """Print general verbose messages."""
     if _verbose:
-        _console.print(*args, style="dim")
-        _console.file.flush()
+        _get_console().print(*args, style="dim")
 
 
 def print_trace(*args: Any) -> None:  # noqa: ANN401
     """Print trace messages (extra verbose)."""
     if _trace:
-        _console.print(*args, style="dim")
-        _console.file.flush()
+        _get_console().print(*args, style="dim")
 
 
 def print_exception() -> None:
     """Print exception with traceback and local variables."""
     if os.environ.get("PYTEST_CURRENT_TEST"):
-        traceback.print_exc(file=_console.file)
+        traceback.print_exc(file=_get_console().file)
         return
-    _console.print_exception(show_locals=True)
-    _console.file.flush()
+    _get_console().print_exception(show_locals=True)
+    flush_now()
 
 
 def print_entry(command: list[str]) -> None:
     """Print a process entry event, verbose mode."""
     if _verbose:
-        _console.print("[bold]>", *_style_command(command))
-        _console.file.flush()
+        _get_console().print("[bold]>", *_style_command(command))
 
 
 def print_event(message: str) -> None:
     """Print an event message, verbose mode."""
     if _verbose:
-        _console.print("[bold]>", escape(message), style="magenta")
-        _console.file.flush()
+        _get_console().print("[bold]>", escape(message), style="magenta")
 
 
 def print_command(command: list[str] | EditorCommand) -> None:
@@ -84,8 +154,7 @@ def print_command(command: list[str] | EditorCommand) -> None:
     if isinstance(command, EditorCommand):
         command = command.command_words()
     words = _style_command(command)
-    _console.print("  [bold]$", *words, style="dim")
-    _console.file.flush()
+    _get_console().print("  [bold]$", *words, style="dim")
 
 
 def _style_command(command: list[str]) -> Iterable[str]:
@@ -113,22 +182,20 @@ def _style_shell_word(word: str, *, first: bool) -> str:
 def print_success(*args: Any) -> None:  # noqa: ANN401
     """Print a success message."""
     if _verbose:
-        _console.print(*args, style="blue")
-        _console.file.flush()
+        _get_console().print(*args, style="blue")
 
 
 def print_warning(*args: Any) -> None:  # noqa: ANN401
     """Print a warning message."""
     if _verbose:
-        _console.print(*args, style="yellow")
-        _console.file.flush()
+        _get_console().print(*args, style="yellow")
 
 
 def print_error(title: str | None, *args: Any) -> None:  # noqa: ANN401
     """Print an error message."""
     title = title or "Error:"
-    _console.print(f"[bold]{title}", *args, style="red")
-    _console.file.flush()
+    _get_console().print(f"[bold]{title}", *args, style="red")
+    flush_now()
 
 
 @contextmanager
@@ -142,12 +209,14 @@ def setup_log_file() -> Iterator[None]:
     copy the log file to stderr when done.
     """
     with _open_log_file() as (append_file, read_file):
-        saved_file = _console.file
-        _console.file = append_file
+        console = _get_console()
+        saved_file = console.file
+        console.file = cast("IO[str]", _DeferredFlushFile(append_file))
         try:
             yield
         finally:
-            _console.file = saved_file
+            flush_now()
+            console.file = saved_file
             if read_file:
                 while chunk := read_file.read(64 * 1024):
                     sys.stderr.write(chunk)
@@ -2,7 +2,6 @@
 
 import functools
 import json
-import re
 import subprocess
 import threading
 import typing
@@ -21,6 +20,8 @@ from tuick.tool_registry import (
 if typing.TYPE_CHECKING:
     from collections.abc import Iterable, Iterator
 
+MARKERS = "\x00\x02\x03\n"
+
 
 class ErrorformatNotFoundError(Exception):
     """Errorformat CLI not found."""
@@ -116,12 +117,15 @@ def run_errorformat(  # noqa: C901
                 raise AssertionError(msg)
     try:
         print_command(cmd)
+        # Wide pipes keep the writer thread and errorformat from
+        # blocking each other on bursts; ignored without F_SETPIPE_SZ
         proc = subprocess.Popen(
             cmd,
             stdin=subprocess.PIPE,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
             text=True,
+            pipesize=1 << 20,
         )
     except FileNotFoundError as exc:
         raise ErrorformatNotFoundError from exc
@@ -202,6 +206,9 @@ def group_entries_by_location(  # noqa: C901, PLR0912
     """
     pending_note: ErrorformatEntry | None = None
     pending_block: ErrorformatEntry | None = None
+    # Location of pending_block, tracked incrementally so repeated
+    # locations skip rebuilding the tuple per entry
+    pending_loc: tuple[str, int | None, int | None] | None = None
 
     for entry in entries:
         if not entry.lnum:
@@ -232,11 +239,6 @@ def group_entries_by_location(  # noqa: C901, PLR0912
                 pending_note = None
 
             loc = (entry.filename, entry.lnum, entry.col)
-            pending_loc = (
-                (pending_block.filename, pending_block.lnum, pending_block.col)
-                if pending_block
-                else None
-            )
 
             if pending_loc == loc:
                 # Same location - merge
@@ -256,6 +258,7 @@ def group_entries_by_location(  # noqa: C901, PLR0912
                     pending_note = None
                 else:
                     pending_block = entry
+                pending_loc = loc
 
     # Flush remaining
     if pending_block:
@@ -269,15 +272,15 @@ def format_block_from_entry(entry: ErrorformatEntry) -> str:
 
     Block format: file\x1fline\x1fcol\x1fend-line\x1fend-col\x1ftext\0
     """
-    text = "\n".join(entry.lines)
-    line_str = str(entry.lnum) if entry.lnum is not None else ""
-    col_str = str(entry.col) if entry.col is not None else ""
-    end_line_str = str(entry.end_lnum) if entry.end_lnum is not None else ""
-    end_col_str = str(entry.end_col) if entry.end_col is not None else ""
-    return (
-        f"{entry.filename}\x1f{line_str}\x1f{col_str}\x1f"
-        f"{end_line_str}\x1f{end_col_str}\x1f{text}\0"
+    fields = (
+        entry.filename,
+        str(entry.lnum) if entry.lnum is not None else "",
+        str(entry.col) if entry.col is not None else "",
+        str(entry.end_lnum) if entry.end_lnum is not None else "",
+        str(entry.end_col) if entry.end_col is not None else "",
+        "\n".join(entry.lines),
     )
+    return "\x1f".join(fields) + "\0"
 
 
 def group_pytest_entries(  # noqa: C901, PLR0912
@@ -372,15 +375,55 @@ def parse_with_errorformat(
     Yields:
         Null-terminated block chunks (with ANSI codes preserved)
     """
-    # Build mapping from stripped lines to original (with ANSI) while streaming
-    stripped_to_original: dict[str, str] = {}
+    # Track (stripped, original) pairs in input order.  Errorformat may
+    # drop lines but never adds or reorders them, so originals are
+    # restored by a forward scan instead of a dict, which collapsed
+    # duplicate stripped lines onto a single original.
+    tracked: list[tuple[str, str]] = []
+    saw_escape = False
+    input_done = False
 
     def strip_and_track(lines: Iterable[str]) -> Iterator[str]:
-        """Strip ANSI codes and track mapping while streaming."""
+        """Strip ANSI codes and track original lines while streaming."""
+        nonlocal input_done, saw_escape
         for line in lines:
             stripped = strip_ansi(line)
-            stripped_to_original[stripped.rstrip("\n")] = line.rstrip("\n")
+            # One end-of-line check instead of two rstrip scans; lines
+            # carry at most one trailing newline
+            if stripped is line:
+                text = line[:-1] if line[-1:] == "\n" else line
+                tracked.append((text, text))
+            else:
+                saw_escape = True
+                if line[-1:] == "\n":
+                    tracked.append((stripped[:-1], line[:-1]))
+                else:
+                    tracked.append((stripped, line))
             yield stripped
+        input_done = True
+
+    pos = 0
+
+    def restore(line: str) -> str:
+        """Return the original colored line matching a stripped line."""
+        nonlocal pos
+        if input_done and not saw_escape:
+            # The whole input was consumed without any escape: every
+            # original is its stripped form and the scan can be
+            # skipped.  While input is still streaming the scan must
+            # run regardless, to keep the cursor mapping duplicate
+            # stripped lines onto their own originals.
+            return line
+        for idx in range(pos, len(tracked)):
+            if tracked[idx][0] == line:
+                pos = idx + 1
+                return tracked[idx][1]
+        # Out-of-order line (e.g. a note flushed late by grouping):
+        # rescan from the start without moving the cursor
+        for idx in range(pos):
+            if tracked[idx][0] == line:
+                return tracked[idx][1]
+        return line
 
     # Parse with errorformat using stripped lines
     entries = run_errorformat(config, strip_and_track(lines))
@@ -394,10 +437,8 @@ def parse_with_errorformat(
                 entries = group_pytest_entries(entries)
 
     for entry in entries:
-        # Restore original colored lines from mapping
-        entry.lines = [
-            stripped_to_original.get(line, line) for line in entry.lines
-        ]
+        # Restore original colored lines
+        entry.lines = [restore(line) for line in entry.lines]
         yield format_block_from_entry(entry)
 
 
@@ -416,18 +457,30 @@ def split_at_markers(lines: Iterable[str]) -> Iterator[tuple[bool, str]]:
         swap, buffer = buffer, []
         return "".join(swap)
 
-    for line in lines:
-        parts = re.split("(\x00|\x02|\x03|\n)", line)
-        for part in parts:
-            if part == "\x02":
+    for piece in lines:
+        pos = 0
+        size = len(piece)
+        while pos < size:
+            # Locate the earliest marker with C-level scans, narrowing
+            # the search bound as closer markers are found, instead of
+            # a regex split allocating a parts list per piece
+            nxt = size
+            char = ""
+            for marker in MARKERS:
+                idx = piece.find(marker, pos, nxt)
+                if idx != -1:
+                    nxt, char = idx, marker
+            if nxt > pos:
+                buffer.append(piece[pos:nxt])
+            pos = nxt + 1
+            if char == "\x02":
                 in_nested = True
-            elif part == "\x03":
+            elif char == "\x03":
                 in_nested = False
-            else:
-                if part:
-                    buffer.append(part)
-                nested_separator = part == "\x00" and in_nested
-                line_end = part == "\n" and not in_nested
+            elif char:
+                buffer.append(char)
+                nested_separator = char == "\x00" and in_nested
+                line_end = char == "\n" and not in_nested
                 if buffer and (nested_separator or line_end):
                     yield (in_nested, flush())
     if buffer:
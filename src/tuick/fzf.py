@@ -17,6 +17,22 @@ if TYPE_CHECKING:
     from tuick.reload_socket import TuickServerInfo
 
 
+# Bindings and options that do not depend on runtime state, built once
+# at import instead of on every fzf launch
+_STATIC_BINDINGS = (
+    "q:abort",
+    "space:down",
+    "backspace:up",
+    "/,ctrl-/:toggle-preview",
+    "home:first",
+    "end:last",
+)
+_STATIC_OPTIONS = (
+    *("fzf", "--listen", "--read0", "--track"),
+    *("--no-sort", "--reverse", "--header-border"),
+)
+
+
 class FzfUserInterface:
     """Define user interface elements for fzf."""
 
@@ -71,12 +87,14 @@ def open_fzf_process(
     theme: ColorTheme,
 ) -> Iterator[subprocess.Popen[str]]:
     """Open and manage fzf process."""
-    env = os.environ.copy()
+    overrides = {
+        "TUICK_PORT": str(tuick_server_info.port),
+        "TUICK_API_KEY": tuick_server_info.api_key,
+        "FZF_API_KEY": fzf_api_key,
+    }
     if theme != ColorTheme.BW:
-        env["FORCE_COLOR"] = "1"
-    env["TUICK_PORT"] = str(tuick_server_info.port)
-    env["TUICK_API_KEY"] = tuick_server_info.api_key
-    env["FZF_API_KEY"] = fzf_api_key
+        overrides["FORCE_COLOR"] = "1"
+    env = os.environ | overrides
 
     # Have output, start fzf
     def binding_verbose(
@@ -97,14 +115,9 @@ def open_fzf_process(
         f"r:change-header({user_interface.running_header})",
         *binding_verbose("r", "RELOAD", plus=True),
         f"r:+reload({callbacks.reload_command})",
-        "q:abort",
         *binding_verbose("zero", "ZERO"),
         "zero:+accept",
-        "space:down",
-        "backspace:up",
-        "/,ctrl-/:toggle-preview",
-        "home:first",
-        "end:last",
+        *_STATIC_BINDINGS,
     ]
     color_opt = (
         ["--no-color"]
@@ -112,8 +125,7 @@ def open_fzf_process(
         else [f"--color={theme.value}"]
     )
     fzf_cmd = [
-        *("fzf", "--listen", "--read0", "--track"),
-        *("--no-sort", "--reverse", "--header-border"),
+        *_STATIC_OPTIONS,
         *("--ansi", *color_opt, "--highlight-line", "--wrap"),
         *("--delimiter=\x1f", "--with-nth=6"),
         *("--preview", _get_preview_command(theme)),
@@ -1,27 +1,25 @@
 """Filesystem monitoring."""
 
+import queue
 import subprocess
 import sys
 import threading
-from collections.abc import (
-    Iterable,  # noqa: TC003 dataclass runtime annotation
-)
 from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 import requests
 
-from tuick.console import print_event, print_verbose
+from tuick.console import print_event, print_exception, print_verbose
 from tuick.reload_socket import generate_api_key
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import Iterable, Iterator
 
     from tuick.reload_socket import ReloadSocketServer
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MonitorChange:
     """A filesystem changes."""
 
@@ -31,25 +29,25 @@ class MonitorChange:
     @classmethod
     def from_line(cls, line: str) -> MonitorChange:
         """Create a MonitorChange from a single watchexec output line."""
-        text = line.removesuffix("\n")
-        if ":" not in text:
+        # One partition scan instead of a containment check plus split
+        kind, sep, rest = line.removesuffix("\n").partition(":")
+        if not sep:
             raise ValueError(  # noqa: TRY003
-                f"Expected colon-separated change, received: {text!r}"
+                f"Expected colon-separated change, received: {kind!r}"
             )
-        parts = text.split(":", maxsplit=1)
-        return cls(parts[0], Path(parts[1]))
+        return cls(kind, Path(rest))
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MonitorEvent:
     """A group of filesystem changes in a single event."""
 
-    changes: Iterable[MonitorChange]
+    changes: tuple[MonitorChange, ...]
 
     @classmethod
     def from_lines(cls, lines: Iterable[str]) -> MonitorEvent:
         """Create MonitorEvent from a group of watchexec output lines."""
-        return cls([MonitorChange.from_line(x) for x in lines])
+        return cls(tuple(MonitorChange.from_line(x) for x in lines))
 
 
 class FilesystemMonitor:
@@ -63,6 +61,9 @@ class FilesystemMonitor:
             "--emit-events-to=stdio",
             "--no-meta",
             "--postpone",
+            # Coalesce write-then-rename editor saves and VCS bursts
+            # into one event, so one save triggers one reload
+            "--debounce=50ms",
         ]
         self._proc = subprocess.Popen(
             cmd,
@@ -77,18 +78,36 @@ class FilesystemMonitor:
         """Iterate over filesystem change events."""
         assert self._proc.stdout is not None
 
-        lines: list[str] = []
-        while True:
-            for line in self._proc.stdout:
-                if line == "\n":  # Empty line, group separator
-                    break
-                lines.append(line)
-            else:  # End of stream
-                break
-            yield MonitorEvent.from_lines(lines)
-            lines = []
-        if lines:
-            yield MonitorEvent.from_lines(lines)
+        # Build changes in the read loop: one pass per event instead of
+        # accumulating lines and mapping them afterwards
+        changes: list[MonitorChange] = []
+        for line in self._proc.stdout:
+            if line == "\n":  # Empty line, group separator
+                # The event snapshots the changes, the list is reusable
+                yield MonitorEvent(tuple(changes))
+                changes.clear()
+                continue
+            changes.append(MonitorChange.from_line(line))
+        if changes:  # End of stream
+            yield MonitorEvent(tuple(changes))
+
+    def iter_triggers(self) -> Iterator[None]:
+        """Iterate over event boundaries without parsing the changes.
+
+        Cheaper than iter_changes when the consumer only cares that an
+        event happened, not what changed.
+        """
+        assert self._proc.stdout is not None
+
+        pending = False
+        for line in self._proc.stdout:
+            if line == "\n":  # Empty line, group separator
+                yield None
+                pending = False
+            else:
+                pending = True
+        if pending:  # End of stream
+            yield None
 
     def stop(self) -> None:
         """Send SIGTERM to the subprocess and wait for it to terminate."""
@@ -117,36 +136,66 @@ class MonitorThread:
         self.verbose = verbose
         self._monitor: FilesystemMonitor | None = None
         self._thread: threading.Thread | None = None
+        # Keep-alive session: reuse the TCP connection to fzf instead
+        # of a fresh pool and handshake per reload
+        self._session = requests.Session()
+        self._session.headers["X-Api-Key"] = self.fzf_api_key
+        self._fzf_url: str | None = None
+        self._body: str | None = None
+        # Size-one queue decouples the pipe read loop from HTTP
+        # latency; a full queue means a reload is already pending, so
+        # further triggers coalesce into it (latest wins).  False is
+        # the shutdown sentinel.
+        self._pending: queue.Queue[bool] = queue.Queue(maxsize=1)
+        self._sender: threading.Thread | None = None
 
     def start(self) -> None:
-        """Start monitoring thread."""
+        """Start monitoring and sender threads."""
         self._monitor = FilesystemMonitor(self.path)
         self._thread = threading.Thread(target=self._run, daemon=True)
         self._thread.start()
+        self._sender = threading.Thread(target=self._send_loop, daemon=True)
+        self._sender.start()
 
     def _run(self) -> None:
-        """Monitor filesystem and send reload commands."""
+        """Monitor filesystem and queue reload triggers."""
         assert self._monitor is not None
-        for _event in self._monitor.iter_changes():
-            self._send_reload()
+        for _ in self._monitor.iter_triggers():
+            try:
+                self._pending.put_nowait(True)
+            except queue.Full:
+                pass  # Reload already pending, coalesce
+        self._pending.put(False)
+
+    def _send_loop(self) -> None:
+        """Drain pending triggers and send reload commands."""
+        while self._pending.get():
+            try:
+                self._send_reload()
+            except requests.RequestException:
+                print_exception()
 
     def _send_reload(self) -> None:
         """Send reload command via HTTP POST to fzf socket."""
-        # Wait for fzf_port to be set by start command
-        self.reload_server.fzf_port_ready.wait()
-
-        assert self.reload_server.fzf_port is not None
-        fzf_url = f"http://127.0.0.1:{self.reload_server.fzf_port}"
-        body = f"change-header({self.loading_header})+reload:{self.reload_cmd}"
-        headers = {"X-Api-Key": self.fzf_api_key}
+        if self._fzf_url is None or self._body is None:
+            # Wait for fzf_port to be set by start command, once: the
+            # port never changes afterwards, so later events skip the
+            # Event lock and the string formatting
+            self.reload_server.fzf_port_ready.wait()
+            assert self.reload_server.fzf_port is not None
+            self._fzf_url = f"http://127.0.0.1:{self.reload_server.fzf_port}"
+            self._body = (
+                f"change-header({self.loading_header})"
+                f"+reload:{self.reload_cmd}"
+            )
 
         if self.verbose:
             print_event("Auto reload")
-            print_verbose("  [bold]POST", fzf_url)
-            print_verbose("    Body:", repr(body))
+            print_verbose("  [bold]POST", self._fzf_url)
+            print_verbose("    Body:", repr(self._body))
 
-        response = requests.post(
-            fzf_url, data=body, headers=headers, timeout=10
+        response = self._session.post(
+            self._fzf_url, data=self._body, timeout=10
         )
 
         if self.verbose:
@@ -160,3 +209,6 @@ class MonitorThread:
             self._monitor.stop()
         if self._thread:
             self._thread.join(timeout=1.0)
+        if self._sender:
+            self._sender.join(timeout=1.0)
+        self._session.close()
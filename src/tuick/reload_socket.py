@@ -37,6 +37,9 @@ class ReloadRequestHandler(socketserver.StreamRequestHandler):
     """Handler for reload coordination messages."""
 
     server: ReloadSocketServer
+    # Messages are tiny request/response exchanges; do not let Nagle
+    # delay them behind a pending ACK
+    disable_nagle_algorithm = True
 
     def handle(self) -> None:  # noqa: C901, PLR0912, PLR0915
         """Process single client connection with authentication."""
@@ -6,6 +6,8 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from collections.abc import Iterable, Iterator
 
+SAFE_WORD_REGEX = re.compile(r"^[a-zA-Z0-9_~\-./=:,@%+]+$")
+
 
 def quote_command(words: Iterable[str]) -> str:
     """Shell quote words and join in a single command string."""
@@ -48,6 +50,6 @@ def _needs_quoting(word: str, first: bool) -> bool:  # noqa: FBT001
     # In the end, basic "a-zA-Z0-9_", additional "~-./=" (not * and ?), and our
     # special list ":,@%+" are safe.
 
-    if not re.match(r"^[a-zA-Z0-9_~\-./=:,@%+]+$", word):
+    if not SAFE_WORD_REGEX.match(word):
         return True
     return (first and "=" in word[1:]) or word[0] == "~"
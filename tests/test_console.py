@@ -19,17 +19,18 @@ def test_setup_log_file_nested_does_not_dump_to_stderr(
 ) -> None:
     """Nested tuick should append to log file without printing to stderr."""
     log_path = tmp_path / "tuick.log"
-    original_file = console._console.file
+    test_console = console._get_console()
+    original_file = test_console.file
 
     try:
-        console._console.file = sys.stderr
+        test_console.file = sys.stderr
         with (
             patch.dict(os.environ, {console.TUICK_LOG_FILE: str(log_path)}),
             console.setup_log_file(),
         ):
-            console._console.print("hello")
+            test_console.print("hello")
     finally:
-        console._console.file = original_file
+        test_console.file = original_file
 
     captured = capsys.readouterr()
     assert captured.err == ""
@@ -40,16 +41,17 @@ def test_setup_log_file_top_replays_log_to_stderr(
     capsys: pytest.CaptureFixture[str],
 ) -> None:
     """Top-level tuick copies log contents to stderr on exit."""
-    original_file = console._console.file
+    test_console = console._get_console()
+    original_file = test_console.file
     try:
-        console._console.file = sys.stderr
+        test_console.file = sys.stderr
         with console.setup_log_file():
             log_path = Path(os.environ[console.TUICK_LOG_FILE])
             log_path.write_text("child output\n")
             console.set_verbose()
             console.print_verbose("top output")
     finally:
-        console._console.file = original_file
+        test_console.file = original_file
 
     captured = capsys.readouterr()
     assert captured.out == ""
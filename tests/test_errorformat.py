@@ -183,6 +183,38 @@ def test_parse_with_errorformat_flake8_with_ansi() -> None:
     assert parsed_fmt == expected_fmt
 
 
+def test_parse_with_errorformat_duplicate_lines() -> None:
+    """Regression test: duplicate stripped lines keep their originals.
+
+    Restoration used to map stripped lines to originals through a dict,
+    collapsing duplicates onto the last original. Cover plain
+    duplicates, colored duplicates that strip to the same text, and a
+    plain line followed by a colored line with the same stripped form.
+    """
+    plain = "dup.py:1:1: E101 duplicated message\n"
+    red = "\x1b[31mdup.py:2:1: E102 duplicated message\x1b[m\n"
+    green = "\x1b[32mdup.py:2:1: E102 duplicated message\x1b[m\n"
+    late_plain = "dup.py:3:1: E103 duplicated message\n"
+    late_colored = "\x1b[31mdup.py:3:1: E103 duplicated message\x1b[m\n"
+    input_lines = [plain, plain, red, green, late_plain, late_colored]
+    result = "".join(
+        parse_with_errorformat(FormatName("flake8"), iter(input_lines))
+    )
+
+    expected = [
+        Block("dup.py", "1", "1", "", "", plain.rstrip()),
+        Block("dup.py", "1", "1", "", "", plain.rstrip()),
+        Block("dup.py", "2", "1", "", "", red.rstrip()),
+        Block("dup.py", "2", "1", "", "", green.rstrip()),
+        Block("dup.py", "3", "1", "", "", late_plain.rstrip()),
+        Block("dup.py", "3", "1", "", "", late_colored.rstrip()),
+    ]
+    parsed = [Block.from_block(b) for b in result.strip("\0").split("\0")]
+    expected_fmt = [b.format_for_test() for b in expected]
+    parsed_fmt = [b.format_for_test() for b in parsed]
+    assert parsed_fmt == expected_fmt
+
+
 def test_split_at_markers() -> None:
     """split_at_markers() splits nested and build-system output."""
     # Multiple marker pairs with null-terminated blocks
@@ -10,6 +10,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
 
 from find_multiline_exprs import (
     ClosingDelimiter,
+    _read_lines,
     filter_outermost,
     find_opener,
     main,
@@ -35,7 +36,7 @@ index 06fbfd9..6e60bf4 100644
 +    x
 +)
 """
-    delimiters = list(parse_diff(diff))
+    delimiters = list(parse_diff(diff.splitlines()))
     # Closing paren is at line 4 (2 + 3 - 1), indent 0
     expected = [ClosingDelimiter("test1.py", 4, 0, ")")]
     assert delimiters == expected
@@ -54,7 +55,7 @@ index 2ae2839..3a7d160 100644
 +    3
 +    ]
 """
-    delimiters = list(parse_diff(diff))
+    delimiters = list(parse_diff(diff.splitlines()))
     # Closing bracket is at line 4, indent 4
     expected = [ClosingDelimiter("test2.py", 4, 4, "]")]
     assert delimiters == expected
@@ -70,7 +71,7 @@ index 8ae0569..c3ddfa6 100644
 @@ -1,0 +2 @@
 +)
 """
-    delimiters = list(parse_diff(diff))
+    delimiters = list(parse_diff(diff.splitlines()))
     assert delimiters == []
 
 
@@ -92,7 +93,7 @@ index 2ae2839..51e15be 100644
 +bar[
 +]
 """
-    delimiters = list(parse_diff(diff))
+    delimiters = list(parse_diff(diff.splitlines()))
     # test4a.py closing paren at line 2, indent 0
     # test4b.py closing bracket at line 2, indent 0
     expected = [
@@ -116,7 +117,7 @@ index 086e798..2580cae 100644
 +bar(
 +)
 """
-    delimiters = list(parse_diff(diff))
+    delimiters = list(parse_diff(diff.splitlines()))
     # First closing paren: chunk starts at line 6, paren at line 7
     # Second closing paren: chunk starts at line 22, paren at line 23
     expected = [
@@ -137,7 +138,7 @@ index 2ae2839..a6bfd8d 100644
 +) and more
 +    ]  # comment
 """
-    delimiters = list(parse_diff(diff))
+    delimiters = list(parse_diff(diff.splitlines()))
     # These should be ignored because delimiter is not at line end
     assert delimiters == []
 
@@ -272,7 +273,9 @@ def test_output_context_basic(
 
     # Opener at line 2 (0-indexed: 1), closer at line 5 (0-indexed: 4)
     # With CONTEXT_LINES=5, start = max(1, 2-5) = 1, so includes line1
-    output_context(str(test_file), close_idx=4, opener_idx=1)
+    lines = _read_lines(str(test_file))
+    assert lines is not None
+    output_context(str(test_file), lines, close_idx=4, opener_idx=1)
 
     captured = capsys.readouterr()
     expected = """\
@@ -296,7 +299,9 @@ def test_output_context_with_context_lines(
 
     # Opener at line 10 (0-indexed: 9), closer at line 15 (0-indexed: 14)
     # Context should include lines 5-15 (5 lines before opener)
-    output_context(str(test_file), close_idx=14, opener_idx=9)
+    file_lines = _read_lines(str(test_file))
+    assert file_lines is not None
+    output_context(str(test_file), file_lines, close_idx=14, opener_idx=9)
 
     captured = capsys.readouterr()
     lines_out = captured.out.splitlines()
@@ -319,7 +324,9 @@ def test_output_context_start_of_file(
     test_file.write_text("foo(\n)\n")
 
     # Opener at line 1 (0-indexed: 0), closer at line 2 (0-indexed: 1)
-    output_context(str(test_file), close_idx=1, opener_idx=0)
+    lines = _read_lines(str(test_file))
+    assert lines is not None
+    output_context(str(test_file), lines, close_idx=1, opener_idx=0)
 
     captured = capsys.readouterr()
     expected = """\
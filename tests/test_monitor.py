@@ -10,7 +10,7 @@ from unittest.mock import Mock, patch
 
 import pytest
 
-from tuick.monitor import FilesystemMonitor, MonitorEvent, MonitorThread
+from tuick.monitor import FilesystemMonitor, MonitorThread
 from tuick.reload_socket import ReloadSocketServer
 
 if TYPE_CHECKING:
@@ -82,8 +82,7 @@ def test_monitor_thread_sends_reload_to_socket(
     reload_server.fzf_port_ready.set()
 
     mock_monitor = Mock(spec=FilesystemMonitor)
-    mock_event = Mock(spec=MonitorEvent)
-    mock_monitor.iter_changes.return_value = iter([mock_event])
+    mock_monitor.iter_triggers.return_value = iter([None])
 
     with patch("tuick.monitor.FilesystemMonitor", return_value=mock_monitor):
         monitor_thread = MonitorThread(
@@ -99,5 +98,5 @@ def test_monitor_thread_sends_reload_to_socket(
         finally:
             monitor_thread.stop()
 
-    mock_monitor.iter_changes.assert_called_once()
+    mock_monitor.iter_triggers.assert_called_once()
     mock_monitor.stop.assert_called_once()